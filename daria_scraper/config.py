@@ -12,18 +12,31 @@ LOGGING_CONFIG = {
 # Request configuration
 REQUEST_CONFIG = {
     "HEADERS": {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept-Encoding": "gzip, deflate"
     },
     "TIMEOUT": 30,
     "REQUEST_DELAY": 1,
+    "REQUEST_BURST": 4,
     "RETRY_DELAY": 5,
-    "RETRIES": 3
+    "RETRY_MAX_DELAY": 60,
+    "RETRY_JITTER": 1,
+    "RETRIES": 3,
+    "POOL_SIZE": 32,
+    "MAX_CONCURRENCY": 5
 }
 
 # Output configuration
 OUTPUT_CONFIG = {
     "DATA_DIR": "data",
-    "FILENAME_PREFIX": "daria_scraper"
+    "FILENAME_PREFIX": "daria_scraper",
+    "PRETTY": False
+}
+
+# HTTP cache configuration (stored under DATA_DIR)
+CACHE_CONFIG = {
+    "CACHE_NAME": "http_cache",
+    "EXPIRE_AFTER": 3600
 }
 
 # Target websites
@@ -3,19 +3,56 @@ Main entry point for the Daria Outpost Reborn web scraper.
 This script provides a focused approach to scrape character
 information and alter ego images.
 """
-import time
-import logging
-import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urljoin
-# import re
+from urllib.parse import urljoin, urldefrag
 import requests
-from bs4 import BeautifulSoup
+import orjson
+import lxml.html
+from lxml import etree
 
 # Import from our package
 from daria_scraper import config
+from daria_scraper.utils.logging import setup_logging
+from daria_scraper.utils.rate_limit import TokenBucket
+from daria_scraper.utils.session import create_session, get_cached
+
+# Used to lowercase attribute and text values inside XPath 1.0 expressions
+_XPATH_LOWER = "translate({}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# First link on the characters index whose href contains $pattern (e.g., ch_daria.html)
+_CHARACTER_LINK_BY_HREF_XPATH = etree.XPath(
+    f"(//a[contains({_XPATH_LOWER.format('@href')}, $pattern)])[1]"
+)
+
+# First link on the characters index whose text equals $name
+_CHARACTER_LINK_BY_TEXT_XPATH = etree.XPath(
+    f"(//a[@href != ''][{_XPATH_LOWER.format('normalize-space(.)')} = $name])[1]"
+)
+
+# Elements wrapping a bold "Full Name:" label on a character page
+_FULL_NAME_PARENTS_XPATH = etree.XPath(
+    "//*[self::strong or self::b][contains(., 'Full Name:')]/.."
+)
+
+# First link to the alter egos page on a character page
+_ALTER_EGOS_LINK_XPATH = etree.XPath(
+    "(//a[contains(@href, 'art_alter-egos.html')])[1]"
+)
+
+# Character section on the alter egos page: the element with id $fragment,
+# or else the parent of the <a name="..."> anchor
+_SECTION_XPATH = etree.XPath(
+    "(//*[@id = $fragment])[1]"
+    " | (//a[@name = $fragment][not(//*[@id = $fragment])])[1]/.."
+)
+
+# Images under a node whose src contains $prefix (e.g., daria_1.jpg), ignoring case
+_CHARACTER_IMAGES_XPATH = etree.XPath(
+    f".//img[contains({_XPATH_LOWER.format('@src')}, $prefix)]"
+)
 
 class DariaScraper:
     """Scraper class focused on extracting character info and alter ego images."""
@@ -24,29 +61,32 @@ class DariaScraper:
         """Initialize the scraper with configuration settings."""
         self.logger = self._setup_logging()
         self.target = config.TARGETS[0]
-        self.session = requests.Session()
-        self.session.headers.update(config.REQUEST_CONFIG["HEADERS"])
         self.data_dir = Path(config.OUTPUT_CONFIG["DATA_DIR"])
         self.data_dir.mkdir(exist_ok=True)
+        self.session = create_session(config, self.data_dir)
+        self._limiter = TokenBucket.from_delay(
+            config.REQUEST_CONFIG["REQUEST_DELAY"],
+            config.REQUEST_CONFIG["REQUEST_BURST"]
+        )
 
         self.logger.info("Initialized scraper for %s", self.target['name'])
 
     def _setup_logging(self):
-        """Set up logging configuration."""
-        log_config = config.LOGGING_CONFIG
-        logging.basicConfig(
-            level=getattr(logging, log_config["LEVEL"]),
-            format=log_config["LOG_FORMAT"],
-            handlers=[
-                logging.FileHandler(log_config["LOG_FILE"]),
-                logging.StreamHandler()
-            ]
-        )
-        return logging.getLogger("daria_scraper")
+        """Set up queued logging so worker threads never block on log I/O."""
+        return setup_logging(config.LOGGING_CONFIG)
 
-    def fetch_page(self, url, retry_count=0):
-        """Fetch a page with retry logic."""
+    def fetch_page(self, url):
+        """Fetch a page; retries are handled by the session's adapter."""
         try:
+            # Fresh cached pages are served without waiting on the rate limiter
+            response = get_cached(self.session, url)
+            if response is not None:
+                self.logger.info("Using cached response: %s", url)
+                return response
+
+            # Rate-limit outgoing requests to avoid hammering the server
+            self._limiter.acquire()
+
             self.logger.info("Requesting: %s", url)
             response = self.session.get(
                 url,
@@ -54,33 +94,42 @@ class DariaScraper:
             )
             response.raise_for_status()
 
-            # Add delay to avoid hammering the server
-            time.sleep(config.REQUEST_CONFIG["REQUEST_DELAY"])
-
             return response
         except requests.exceptions.RequestException as e:
             self.logger.error("Error fetching %s: %s", url, e)
-            if retry_count < config.REQUEST_CONFIG["RETRIES"]:
-                self.logger.info("Retrying (%d/%d)...", retry_count + 1, config.REQUEST_CONFIG['RETRIES'])
-                time.sleep(config.REQUEST_CONFIG["RETRY_DELAY"])
-                return self.fetch_page(url, retry_count + 1)
-            else:
-                self.logger.error("Max retries reached. Giving up.")
-                return None
+            return None
+
+    def parse_tree(self, html_content, encoding=None):
+        """
+        Parse raw HTML bytes (or text) into an lxml element tree for XPath queries.
 
-    def parse_html(self, html_content):
-        """Parse HTML content using BeautifulSoup."""
-        return BeautifulSoup(html_content, 'html.parser')
+        Args:
+            html_content: Raw HTML content as bytes or string
+            encoding: Encoding from the response's Content-Type header (optional);
+                without it libxml2 falls back to Latin-1 on pages lacking <meta charset>
 
-    def save_data(self, data, filename_prefix):
-        """Save the scraped data to a file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        Returns:
+            lxml root element; an empty <html> element when there is nothing to parse
+        """
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        try:
+            return lxml.html.document_fromstring(html_content, parser=parser)
+        except etree.ParserError:
+            # An empty body has no document; give callers a tree with no matches
+            return lxml.html.Element('html')
+
+    def save_data(self, data, filename_prefix, timestamp=None):
+        """Save the scraped data to a file, reusing the given timestamp for batch runs."""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{filename_prefix}_{timestamp}.json"
         filepath = self.data_dir / filename
 
+        # Write compact JSON unless pretty output is requested
+        option = orjson.OPT_INDENT_2 if config.OUTPUT_CONFIG["PRETTY"] else 0
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
             return filepath
         except Exception as e:
             self.logger.error("Error saving data: %s", e)
@@ -104,94 +153,81 @@ class DariaScraper:
             self.logger.error("Failed to retrieve the characters page.")
             return None
 
-        soup = self.parse_html(response.text)
+        tree = self.parse_tree(response.content, response.encoding)
+        name_lower = character_name.lower()
 
         # First, try to find by specific href pattern (e.g., ch_daria.html)
-        for link in soup.select("a"):
-            href = link.get('href', '')
-            if href and f"ch_{character_name.lower()}.html" in href.lower():
-                char_url = urljoin(self.target['base_url'], href)
-                self.logger.info("Found %s's character page by href: %s", character_name, char_url)
-                return char_url
+        links = _CHARACTER_LINK_BY_HREF_XPATH(tree, pattern=f"ch_{name_lower}.html")
+        if links:
+            char_url = urljoin(self.target['base_url'], links[0].get('href'))
+            self.logger.info("Found %s's character page by href: %s", character_name, char_url)
+            return char_url
 
         # If not found by href, try by link text
-        for link in soup.select("a"):
-            text = link.text.strip()
-            if text.lower() == character_name.lower():
-                href = link.get('href', '')
-                if href:
-                    char_url = urljoin(self.target['base_url'], href)
-                    self.logger.info("Found %s's character page by text: %s", character_name, char_url)
-                    return char_url
+        links = _CHARACTER_LINK_BY_TEXT_XPATH(tree, name=name_lower)
+        if links:
+            char_url = urljoin(self.target['base_url'], links[0].get('href'))
+            self.logger.info("Found %s's character page by text: %s", character_name, char_url)
+            return char_url
 
         self.logger.error("Could not find %s's character page", character_name)
         return None
 
-    def extract_character_name(self, soup):
+    def extract_character_name(self, tree):
         """
         Extract a character's full name from their page.
 
         Args:
-            soup: BeautifulSoup object of the character's page
+            tree: lxml root element of the character's page
 
         Returns:
             Character's full name or empty string if not found
         """
-        # Look for "Full Name:" in bold text
-        for bold in soup.find_all(['strong', 'b']):
-            if "Full Name:" in bold.get_text():
-                # Get the parent element that contains the full text
-                parent = bold.parent
-                if parent:
-                    full_text = parent.get_text()
-                    # Extract the name after "Full Name:"
-                    if "Full Name:" in full_text:
-                        name_part = full_text.split("Full Name:", 1)[1].strip()
-                        # If there's another field after the name, cut it off
-                        if "Current Age:" in name_part:
-                            name_part = name_part.split("Current Age:", 1)[0].strip()
-                        return name_part
+        # Look for the element containing a bold "Full Name:" label
+        for parent in _FULL_NAME_PARENTS_XPATH(tree):
+            full_text = parent.text_content()
+            # Extract the name after "Full Name:"
+            if "Full Name:" in full_text:
+                name_part = full_text.split("Full Name:", 1)[1].strip()
+                # If there's another field after the name, cut it off
+                if "Current Age:" in name_part:
+                    name_part = name_part.split("Current Age:", 1)[0].strip()
+                return name_part
 
         return ""
 
-    def find_alter_egos_link(self, soup, character_name):
+    def find_alter_egos_link(self, tree, character_name):
         """
         Find the alter egos page link and fragment identifier from a character page.
 
         Args:
-            soup: BeautifulSoup object of the character's page
+            tree: lxml root element of the character's page
             character_name: Name of the character for logging
 
         Returns:
             Tuple of (alter_egos_url, fragment_identifier) or (None, None) if not found
         """
-        alter_egos_link = None
-        fragment = None
-
-        # Look for links to the alter egos page
-        for link in soup.select("a"):
-            href = link.get('href', '')
-            if href and "art_alter-egos.html" in href:
-                # If the link has a fragment identifier (#daria), extract it
-                if "#" in href:
-                    base_href, fragment = href.split("#", 1)
-                    alter_egos_link = urljoin(self.target['base_url'], base_href)
-                else:
-                    alter_egos_link = urljoin(self.target['base_url'], href)
-
-                self.logger.info("Found alter egos link for %s: %s (fragment: %s)",
-                                character_name, alter_egos_link, fragment)
-                return alter_egos_link, fragment
+        # Look for a link to the alter egos page
+        links = _ALTER_EGOS_LINK_XPATH(tree)
+        if links:
+            # Split off the fragment identifier (#daria), if any
+            href, fragment = urldefrag(links[0].get('href'))
+            fragment = fragment or None
+            alter_egos_link = urljoin(self.target['base_url'], href)
+
+            self.logger.info("Found alter egos link for %s: %s (fragment: %s)",
+                            character_name, alter_egos_link, fragment)
+            return alter_egos_link, fragment
 
         self.logger.warning("Could not find alter egos link for %s", character_name)
         return None, None
 
-    def extract_character_alter_egos(self, soup, character_name, fragment):
+    def extract_character_alter_egos(self, tree, character_name, fragment):
         """
         Extract alter ego images for a specific character from the alter egos page.
 
         Args:
-            soup: BeautifulSoup object of the alter egos page
+            tree: lxml root element of the alter egos page
             character_name: Name of the character to extract images for
             fragment: Fragment identifier for the character's section
 
@@ -202,34 +238,33 @@ class DariaScraper:
         character_id = character_name.lower()
 
         # Try to find the character's section using the fragment
-        section = None
-        if fragment:
-            # First try by id
-            section = soup.find(id=fragment)
-
-            # Then try by name attribute (for <a name="...">)
-            if not section:
-                anchor = soup.find("a", {"name": fragment})
-                if anchor:
-                    section = anchor.parent
+        sections = _SECTION_XPATH(tree, fragment=fragment) if fragment else []
 
         # If we found a specific section, search within it
-        elements_to_search = section.find_all('img') if section else soup.find_all('img')
+        scope = sections[0] if sections else tree
 
-        for img in elements_to_search:
-            src = img.get('src', '')
-            if src and f"{character_id}_" in src.lower():
-                # This is an image for our character
-                if not src.startswith(('http://', 'https://')):
-                    src = urljoin(self.target['base_url'], src)
+        # Select only this character's images (e.g., daria_1.jpg), ignoring case
+        base_url = self.target['base_url']
+        seen = set()
+        for img in _CHARACTER_IMAGES_XPATH(scope, prefix=f"{character_id}_"):
+            src = img.get('src')
 
-                image_data = {
-                    "link": src,
-                    "width": img.get('width', ''),
-                    "height": img.get('height', '')
-                }
+            # Skip images already referenced elsewhere on the page
+            key = src.lower()
+            if key in seen:
+                continue
+            seen.add(key)
 
-                alter_egos.append(image_data)
+            if not src.startswith(('http://', 'https://')):
+                src = urljoin(base_url, src)
+
+            image_data = {
+                "link": src,
+                "width": img.get('width', ''),
+                "height": img.get('height', '')
+            }
+
+            alter_egos.append(image_data)
 
         self.logger.info("Found %d alter ego images for %s", len(alter_egos), character_name)
         return alter_egos
@@ -257,27 +292,27 @@ class DariaScraper:
             self.logger.error("Failed to retrieve %s's character page", character_name)
             return None
 
-        soup = self.parse_html(response.text)
+        tree = self.parse_tree(response.content, response.encoding)
 
         # Step 3: Extract the character's full name
-        full_name = self.extract_character_name(soup)
+        full_name = self.extract_character_name(tree)
         if not full_name:
             self.logger.warning("Could not extract full name for %s, using provided name", character_name)
             full_name = character_name.title()  # Capitalize first letter
 
         # Step 4: Find link to alter egos page
-        alter_egos_url, fragment = self.find_alter_egos_link(soup, character_name)
+        alter_egos_url, fragment = self.find_alter_egos_link(tree, character_name)
 
         alter_egos_images = []
         if alter_egos_url:
             # Step 5: Get the alter egos page
             response = self.fetch_page(alter_egos_url)
             if response:
-                alter_egos_soup = self.parse_html(response.text)
+                alter_egos_tree = self.parse_tree(response.content, response.encoding)
 
                 # Step 6: Extract character's alter ego images
                 alter_egos_images = self.extract_character_alter_egos(
-                    alter_egos_soup, character_name, fragment
+                    alter_egos_tree, character_name, fragment
                 )
             else:
                 self.logger.error("Failed to retrieve the alter egos page")
@@ -297,20 +332,25 @@ class DariaScraper:
             print("No data found for character.")
             return
 
-        # Convert to JSON and print
-        json_data = json.dumps(character_data, indent=2)
-        print("\n" + "="*70)
-        print(f"{character_data.get('full_name', 'Character')} Data with Alter Ego Images")
-        print("="*70)
-        print(json_data)
-        print("="*70)
-
-    def run(self, character_name=None):
+        # Convert to JSON and print as a single block so concurrent runs don't interleave
+        json_data = orjson.dumps(character_data, option=orjson.OPT_INDENT_2).decode()
+        separator = "="*70
+        print("\n".join([
+            "",
+            separator,
+            f"{character_data.get('full_name', 'Character')} Data with Alter Ego Images",
+            separator,
+            json_data,
+            separator
+        ]))
+
+    def run(self, character_name=None, timestamp=None):
         """
         Run the scraper for a specific character or default to Daria.
 
         Args:
             character_name: Name of the character to scrape (defaults to 'daria')
+            timestamp: Timestamp to use in the output filename (defaults to now)
 
         Returns:
             True if successful, False otherwise
@@ -329,7 +369,8 @@ class DariaScraper:
             # Save the data
             output_file = self.save_data(
                 character_data,
-                f"{config.OUTPUT_CONFIG['FILENAME_PREFIX']}_{character_name.lower()}_character"
+                f"{config.OUTPUT_CONFIG['FILENAME_PREFIX']}_{character_name.lower()}_character",
+                timestamp
             )
 
             if output_file:
@@ -341,18 +382,44 @@ class DariaScraper:
         self.logger.info("Scraping complete")
         return False
 
+    def run_many(self, character_names):
+        """
+        Run the scraper for several characters concurrently.
+
+        Requests from all workers share the session's connection pool, cache
+        and rate limiter.
+
+        Args:
+            character_names: Names of the characters to scrape
+
+        Returns:
+            True if every character was scraped successfully, False otherwise
+        """
+        max_workers = max(1, min(config.REQUEST_CONFIG["MAX_CONCURRENCY"], len(character_names)))
+
+        # Share one timestamp so all files from this batch are named consistently
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda name: self.run(name, timestamp), character_names))
+
+        return all(results)
+
 
 def main():
     """Main entry point for the scraper."""
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Scrape Daria character information")
-    parser.add_argument("character", nargs="?", default="daria",
-                        help="Name of the character to scrape (default: daria)")
+    parser.add_argument("characters", nargs="*", default=["daria"],
+                        help="Names of the characters to scrape (default: daria)")
     args = parser.parse_args()
 
     # Create and run the scraper
     scraper = DariaScraper()
-    scraper.run(args.character)
+    if len(args.characters) > 1:
+        scraper.run_many(args.characters)
+    else:
+        scraper.run(args.characters[0])
 
 if __name__ == "__main__":
     main()
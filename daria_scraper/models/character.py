@@ -5,6 +5,8 @@ Character model representing a character from the Daria series.
 class Character:
     """Model representing a character from the Daria series."""
 
+    __slots__ = ('url', 'full_name', 'alter_egos_images')
+
     def __init__(self, url=""):
         """
         Initialize a character model.
@@ -5,29 +5,38 @@ HTML parser for processing web page content.
 import re
 from bs4 import BeautifulSoup
 
+# Script and style blocks and comments are never queried, so drop them before parsing
+_STRIP_RE = re.compile(rb'<(script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.DOTALL | re.IGNORECASE)
+
 class HtmlParser:
     """Parser for HTML content with utility methods for common operations."""
 
-    def __init__(self, parser='html.parser'):
+    def __init__(self, parser='lxml'):
         """
         Initialize the HTML parser.
 
         Args:
-            parser: BeautifulSoup parser to use (default: 'html.parser')
+            parser: BeautifulSoup parser to use (default: 'lxml')
         """
         self.parser_type = parser
 
-    def parse(self, html_content):
+    def parse(self, html_content, parse_only=None, encoding=None):
         """
         Parse HTML content using BeautifulSoup.
 
         Args:
-            html_content: Raw HTML content as string
+            html_content: Raw HTML content as string or bytes
+            parse_only: SoupStrainer limiting which tags are built (optional)
+            encoding: Known encoding of byte content, skips detection (optional)
 
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(html_content, self.parser_type)
+        if isinstance(html_content, bytes):
+            html_content = _STRIP_RE.sub(b'', html_content)
+
+        return BeautifulSoup(html_content, self.parser_type,
+                             parse_only=parse_only, from_encoding=encoding)
 
     def find_element_by_text(self, soup, text, tag=None, partial=True):
         """
@@ -42,19 +51,17 @@ class HtmlParser:
         Returns:
             Matching element or None if not found
         """
-        elements = soup.find_all(tag) if tag else soup.find_all()
-
-        for element in elements:
-            if not element.string:
-                continue
+        needle = text.lower()
 
-            element_text = element.string.strip()
+        def matches(string):
+            if not string:
+                return False
 
-            if (partial and text.lower() in element_text.lower()) or \
-               (not partial and text.lower() == element_text.lower()):
-                return element
+            element_text = string.strip().lower()
+            return needle in element_text if partial else needle == element_text
 
-        return None
+        # Let bs4 stop at the first element whose .string matches
+        return soup.find(tag or True, string=matches)
 
     def find_element_by_regex(self, soup, pattern, tag=None):
         """
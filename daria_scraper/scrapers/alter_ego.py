@@ -2,8 +2,12 @@
 Alter ego scraper for extracting character alter ego images from the Daria website.
 """
 
+from itertools import chain, takewhile
 from daria_scraper.scrapers.base import BaseScraper
 
+# Headings that start the next character's section
+_SECTION_HEADINGS = ('h1', 'h2', 'h3', 'h4')
+
 class AlterEgoScraper(BaseScraper):
     """Specialized scraper for character alter ego images."""
 
@@ -97,24 +101,23 @@ class AlterEgoScraper(BaseScraper):
             List of image data dictionaries
         """
         images = []
-        current = section
-        in_section = True
-
-        while current and in_section:
-            # Check if this is a new section header (stop when we hit one)
-            if current != section and current.name in ['h1', 'h2', 'h3', 'h4'] and self.extract_text(current):
-                in_section = False
-                break
-
-            # Extract images from this element
-            for img in current.find_all('img'):
-                image_data = self._extract_image_data(img)
+        seen = set()
+
+        # The section and its following siblings, up to the next non-empty heading
+        elements = chain((section,), takewhile(
+            lambda el: not (el.name in _SECTION_HEADINGS and self.extract_text(el)),
+            section.next_siblings))
+
+        for element in elements:
+            # Text nodes between elements have no images to extract
+            if element.name is None:
+                continue
+
+            for img in element.find_all('img'):
+                image_data = self._extract_image_data(img, seen)
                 if image_data:
                     images.append(image_data)
 
-            # Move to next sibling
-            current = current.next_sibling
-
         return images
 
     def _extract_images_by_character_name(self, soup, character_name):
@@ -129,15 +132,17 @@ class AlterEgoScraper(BaseScraper):
             List of image data dictionaries
         """
         images = []
+        seen = set()
+        name = character_name.lower()
+
+        # Lowercased parent text by id(parent); gallery images often share a parent
+        parent_texts = {}
 
         # Look for images with character name in src, alt, or parent text
         for img in soup.find_all('img'):
-            src = img.get('src', '').lower()
-            alt = img.get('alt', '').lower()
-
             # Check if image seems related to the character
-            if character_name.lower() in src or character_name.lower() in alt:
-                image_data = self._extract_image_data(img)
+            if name in img.get('src', '').lower() or name in img.get('alt', '').lower():
+                image_data = self._extract_image_data(img, seen)
                 if image_data:
                     images.append(image_data)
                 continue
@@ -145,9 +150,11 @@ class AlterEgoScraper(BaseScraper):
             # Check parent element text
             parent = img.parent
             if parent:
-                parent_text = self.extract_text(parent).lower()
-                if character_name.lower() in parent_text:
-                    image_data = self._extract_image_data(img)
+                parent_text = parent_texts.get(id(parent))
+                if parent_text is None:
+                    parent_text = parent_texts[id(parent)] = self.extract_text(parent).lower()
+                if name in parent_text:
+                    image_data = self._extract_image_data(img, seen)
                     if image_data:
                         images.append(image_data)
 
@@ -164,49 +171,44 @@ class AlterEgoScraper(BaseScraper):
             List of image data dictionaries
         """
         images = []
+        seen = set()
 
         for img in soup.find_all('img'):
-            image_data = self._extract_image_data(img)
+            image_data = self._extract_image_data(img, seen)
             if image_data:
                 images.append(image_data)
 
         return images
 
-    def _extract_image_data(self, img):
+    def _extract_image_data(self, img, seen):
         """
         Extract data from an image element.
 
         Args:
             img: BeautifulSoup img element
+            seen: Set of links already extracted, updated in place
 
         Returns:
-            Image data dictionary or None if invalid
+            Image data dictionary or None if invalid or already seen
         """
-        src = img.get('src')
+        attrs = img.attrs
+        src = attrs.get('src')
         if not src:
             return None
 
-        # Get parent link if image is within an <a> tag
-        parent_link = img.find_parent('a')
-
-        if parent_link and parent_link.get('href'):
-            href = parent_link.get('href')
-            link = self.build_full_url(href)
+        # Use the parent link if the image is within an <a> tag, else the source.
+        # The direct parent is checked first to skip the upward walk in the common case
+        parent = img.parent
+        if parent is None or parent.name != 'a':
+            parent = img.find_parent('a')
+        link = (parent.attrs.get('href') if parent else None) or src
 
-            # Only include the link key as requested
-            image_data = {
-                "link": link,
-                "width": img.get('width', ''),
-                "height": img.get('height', '')
-            }
-        else:
-            # If no parent link, use the image source as the link
-            src_url = self.build_full_url(src)
-
-            image_data = {
-                "link": src_url,
-                "width": img.get('width', ''),
-                "height": img.get('height', '')
-            }
+        if link in seen:
+            return None
+        seen.add(link)
 
-        return image_data
+        return {
+            "link": self.http_service.build_url(self.base_url, link),
+            "width": attrs.get('width', ''),
+            "height": attrs.get('height', '')
+        }
@@ -2,6 +2,8 @@
 Base scraper class providing common functionality for all scrapers.
 """
 
+from collections import OrderedDict
+
 class BaseScraper:
     """
     Base class for all scrapers with common functionality.
@@ -10,6 +12,9 @@ class BaseScraper:
     handling common operations like fetching and parsing pages.
     """
 
+    # Maximum number of parsed pages kept by fetch_and_parse
+    PAGE_CACHE_SIZE = 32
+
     def __init__(self, http_service, parser, logger, config):
         """
         Initialize the base scraper.
@@ -25,23 +30,70 @@ class BaseScraper:
         self.logger = logger
         self.config = config
         self.base_url = config.TARGETS[0]['base_url']
+        self._page_cache = OrderedDict()
 
-    def fetch_and_parse(self, url):
+    def fetch_and_parse(self, url, strainer=None):
         """
         Fetch a page and parse it.
 
         Args:
             url: URL to fetch and parse
+            strainer: SoupStrainer to build only the needed tags (optional)
 
         Returns:
             BeautifulSoup object on success, None on failure
         """
+        # Reuse the page if it was already parsed the same way
+        key = (url, strainer)
+        soup = self._page_cache.get(key)
+        if soup is not None:
+            self._page_cache.move_to_end(key)
+            return soup
+
         response = self.http_service.fetch(url)
         if not response:
             self.logger.error("Failed to fetch page: %s", url)
             return None
 
-        return self.parser.parse(response.text)
+        return self._parse_and_cache(key, response)
+
+    def prefetch(self, urls, strainer=None):
+        """
+        Fetch several pages concurrently and cache them for fetch_and_parse.
+
+        Args:
+            urls: URLs to fetch and parse
+            strainer: SoupStrainer to build only the needed tags (optional)
+        """
+        missing = [url for url in urls if (url, strainer) not in self._page_cache]
+        for url, response in self.http_service.fetch_many(missing).items():
+            if response:
+                self._parse_and_cache((url, strainer), response)
+
+    def _parse_and_cache(self, key, response):
+        """
+        Parse a response and store the result in the page cache.
+
+        Args:
+            key: Cache key, a (url, strainer) tuple
+            response: Response object to parse
+
+        Returns:
+            BeautifulSoup object
+        """
+        # Hand over the raw bytes with the known encoding so it is decoded once
+        soup = self.parser.parse(response.content, parse_only=key[1],
+                                 encoding=response.encoding or 'utf-8')
+
+        self._page_cache[key] = soup
+        if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+        return soup
+
+    def clear_cache(self):
+        """Drop all pages cached by fetch_and_parse."""
+        self._page_cache.clear()
 
     def build_full_url(self, path):
         """
@@ -84,16 +136,18 @@ class BaseScraper:
         Returns:
             URL of the first matching link, or None if not found
         """
-        for link in soup.find_all('a'):
-            link_text = self.extract_text(link)
+        needle = text.lower()
+
+        def matches(tag):
+            if tag.name != 'a' or not tag.get('href'):
+                return False
 
-            if (partial and text.lower() in link_text.lower()) or \
-               (not partial and text.lower() == link_text.lower()):
-                href = link.get('href')
-                if href:
-                    return self.build_full_url(href)
+            link_text = self.extract_text(tag).lower()
+            return needle in link_text if partial else needle == link_text
 
-        return None
+        # soup.find stops at the first match instead of collecting every link
+        link = soup.find(matches)
+        return self.build_full_url(link['href']) if link else None
 
     def find_link_by_href(self, soup, href_pattern):
         """
@@ -106,10 +160,5 @@ class BaseScraper:
         Returns:
             URL of the first matching link, or None if not found
         """
-        for link in soup.find_all('a'):
-            href = link.get('href')
-
-            if href and href_pattern in href:
-                return self.build_full_url(href)
-
-        return None
+        link = soup.find('a', href=lambda href: href and href_pattern in href)
+        return self.build_full_url(link['href']) if link else None
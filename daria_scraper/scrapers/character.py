@@ -3,9 +3,16 @@ Character scraper for extracting character information from the Daria website.
 """
 
 import re
+import logging
+from bs4 import SoupStrainer
 from daria_scraper.scrapers.base import BaseScraper
 from daria_scraper.models.character import Character
 
+# Link lookups only ever look at <a href> tags, so skip building the rest of the page
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+_CURRENT_AGE_RE = re.compile(r"Current Age:")
+
 class CharacterScraper(BaseScraper):
     """Specialized scraper for character information."""
 
@@ -34,7 +41,7 @@ class CharacterScraper(BaseScraper):
         """
         self.logger.info("Looking for %s's character page link", character_name)
 
-        soup = self.fetch_and_parse(characters_url)
+        soup = self.fetch_and_parse(characters_url, _LINK_STRAINER)
         if not soup:
             return None
 
@@ -53,6 +60,44 @@ class CharacterScraper(BaseScraper):
 
         return character_link
 
+    def scrape_all(self, characters_url, character_names):
+        """
+        Scrape info and alter egos for several characters in one batch.
+
+        The characters index is fetched once and the character pages are
+        fetched concurrently in batches that fit the page cache, so no
+        prefetched page is evicted before it is used.
+
+        Args:
+            characters_url: URL of the characters index page
+            character_names: Names of the characters to scrape
+
+        Returns:
+            Dictionary mapping each name to its Character model, or None if not found
+        """
+        # Links are resolved against the same cached index page
+        character_links = {name: self.find_character_link(characters_url, name)
+                           for name in character_names}
+
+        # Leave room in the page cache for the index and alter egos pages
+        batch_size = max(1, self.PAGE_CACHE_SIZE - 2)
+        links = list(character_links.items())
+
+        characters = {}
+        for start in range(0, len(links), batch_size):
+            batch = links[start:start + batch_size]
+            self.prefetch([url for _, url in batch if url])
+
+            for name, character_url in batch:
+                character = self.scrape_character_info(character_url) if character_url else None
+                if character:
+                    alter_egos_url, fragment = self.find_alter_egos_link(character_url)
+                    if alter_egos_url:
+                        self.scrape_alter_egos(alter_egos_url, fragment, character)
+                characters[name] = character
+
+        return characters
+
     def scrape_character_info(self, character_url):
         """
         Scrape character information from a character page.
@@ -93,23 +138,24 @@ class CharacterScraper(BaseScraper):
                 if parent:
                     parent_text = self.extract_text(parent)
                     if "Full Name:" in parent_text:
-                        full_name = parent_text.split("Full Name:", 1)[1].strip()
+                        full_name = parent_text.split("Full Name:", 1)[1]
                         # Clean up the name if it contains other text
-                        if "Current Age:" in full_name:
-                            full_name = full_name.split("Current Age:", 1)[0].strip()
+                        full_name = _CURRENT_AGE_RE.split(full_name, 1)[0].strip()
                         character.full_name = full_name
                         self.logger.info("Found Full Name: %s", full_name)
                         return
 
-        # If name not found yet, try broader search
-        for element in soup.find_all(text=re.compile("Full Name:", re.IGNORECASE)):
+        # If name not found yet, try broader search over the page's text nodes
+        for element in soup.strings:
+            if "full name:" not in element.lower():
+                continue
+
             parent = element.parent
             if parent:
                 parent_text = self.extract_text(parent)
                 if "Full Name:" in parent_text:
-                    full_name = parent_text.split("Full Name:", 1)[1].strip()
-                    if "Current Age:" in full_name:
-                        full_name = full_name.split("Current Age:", 1)[0].strip()
+                    full_name = parent_text.split("Full Name:", 1)[1]
+                    full_name = _CURRENT_AGE_RE.split(full_name, 1)[0].strip()
                     character.full_name = full_name
                     self.logger.info("Found Full Name: %s", full_name)
                     return
@@ -126,23 +172,24 @@ class CharacterScraper(BaseScraper):
         """
         self.logger.info("Looking for alter egos link from: %s", character_url)
 
+        # Parse the full page so the tree cached by scrape_character_info is reused
         soup = self.fetch_and_parse(character_url)
         if not soup:
             return None, None
 
-        # Look for links containing "alter-egos" in href
-        for link in soup.find_all('a'):
-            href = link.get('href')
+        # Look for the first link containing "alter-egos" in href
+        link = soup.select_one('a[href*="art_alter-egos.html"]')
+        if link:
+            href = link['href']
 
-            if href and "art_alter-egos.html" in href:
-                # Extract the fragment identifier if present
-                fragment = None
-                if "#" in href:
-                    href, fragment = href.split("#", 1)
+            # Extract the fragment identifier if present
+            fragment = None
+            if "#" in href:
+                href, fragment = href.split("#", 1)
 
-                full_url = self.build_full_url(href)
-                self.logger.info("Found alter egos link: %s (fragment: %s)", full_url, fragment)
-                return full_url, fragment
+            full_url = self.build_full_url(href)
+            self.logger.info("Found alter egos link: %s (fragment: %s)", full_url, fragment)
+            return full_url, fragment
 
         self.logger.error("Could not find alter egos link")
         return None, None
@@ -183,22 +230,32 @@ class CharacterScraper(BaseScraper):
         if not section:
             section = soup
 
-        # Extract all image links that match the character
-        for img in section.find_all('img'):
-            src = img.get('src')
-            if src and f"{character_id}_" in src.lower():
-                width = img.get('width', '')
-                height = img.get('height', '')
-
-                full_url = self.build_full_url(src)
-
-                # Add image info to character
-                image_info = {
-                    "link": full_url,
-                    "width": width,
-                    "height": height
-                }
-                character.alter_egos_images.append(image_info)
+        # Only pay for per-image log calls when they will be emitted
+        log_images = self.logger.isEnabledFor(logging.INFO)
+
+        # Resolve the URL builder and base URL once rather than per image
+        build_url = self.http_service.build_url
+        base_url = self.base_url
+
+        # Escape the scraped id so it stays a literal inside the CSS string
+        needle = f"{character_id}_".replace('\\', '\\\\').replace('"', '\\"')
+
+        # Select only this character's images (e.g., daria_1.jpg), ignoring case
+        for img in section.select(f'img[src*="{needle}" i]'):
+            attrs = img.attrs
+            width = attrs.get('width', '')
+            height = attrs.get('height', '')
+
+            full_url = build_url(base_url, attrs['src'])
+
+            # Add image info to character
+            image_info = {
+                "link": full_url,
+                "width": width,
+                "height": height
+            }
+            character.alter_egos_images.append(image_info)
+            if log_images:
                 self.logger.info("Found alter ego image: %s", full_url)
 
         return character
@@ -2,9 +2,11 @@
 HTTP service for handling web requests with retry logic and rate limiting.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
-import time
 import requests
+from daria_scraper.utils.rate_limit import TokenBucket
+from daria_scraper.utils.session import create_session, get_cached
 
 class Http:
     """Service for handling HTTP requests with built-in retry logic and rate limiting."""
@@ -19,43 +21,67 @@ class Http:
         """
         self.config = config
         self.logger = logger
-        self.session = requests.Session()
-        self.session.headers.update(config.REQUEST_CONFIG["HEADERS"])
+        self.session = create_session(config, config.OUTPUT_CONFIG["DATA_DIR"])
+        self._limiter = TokenBucket.from_delay(
+            config.REQUEST_CONFIG["REQUEST_DELAY"],
+            config.REQUEST_CONFIG["REQUEST_BURST"]
+        )
 
-    def fetch(self, url, retry_count=0):
+    def fetch(self, url, force_refresh=False):
         """
-        Fetch a URL with retry logic and rate limiting.
+        Fetch a URL with rate limiting; retries are handled by the session's adapter.
 
         Args:
             url: URL to fetch
-            retry_count: Current retry attempt (used internally for recursion)
+            force_refresh: Skip the cache and always request the URL
 
         Returns:
             Response object on success, None on failure
         """
         try:
+            # Fresh cached pages are served without waiting on the rate limiter
+            if not force_refresh:
+                response = get_cached(self.session, url)
+                if response is not None:
+                    self.logger.info("Using cached response: %s", url)
+                    return response
+
+            # Wait for a token to avoid hammering the server
+            self._limiter.acquire()
+
             self.logger.info("Requesting: %s", url)
             response = self.session.get(
                 url,
-                timeout=self.config.REQUEST_CONFIG["TIMEOUT"]
+                timeout=self.config.REQUEST_CONFIG["TIMEOUT"],
+                force_refresh=force_refresh
             )
             response.raise_for_status()
 
-            # Add delay to avoid hammering the server
-            time.sleep(self.config.REQUEST_CONFIG["REQUEST_DELAY"])
-
             return response
         except requests.exceptions.RequestException as e:
             self.logger.error("Error fetching %s: %s", url, e)
-            if retry_count < self.config.REQUEST_CONFIG["RETRIES"]:
-                self.logger.info("Retrying (%d/%d)...",
-                                retry_count + 1,
-                                self.config.REQUEST_CONFIG['RETRIES'])
-                time.sleep(self.config.REQUEST_CONFIG["RETRY_DELAY"])
-                return self.fetch(url, retry_count + 1)
-            else:
-                self.logger.error("Max retries reached. Giving up.")
-                return None
+            return None
+
+    def fetch_many(self, urls):
+        """
+        Fetch several URLs concurrently.
+
+        Requests share the session's connections and the rate limiter, so
+        concurrency never exceeds the configured request rate.
+
+        Args:
+            urls: URLs to fetch
+
+        Returns:
+            Dictionary mapping each URL to its response, or None on failure
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        max_workers = min(self.config.REQUEST_CONFIG["MAX_CONCURRENCY"], len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(urls, executor.map(self.fetch, urls)))
 
     def build_url(self, base_url, path):
         """
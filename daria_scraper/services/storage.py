@@ -2,10 +2,10 @@
 Storage service for saving scraped data to files.
 """
 
-import json
 import csv
 from datetime import datetime
 from pathlib import Path
+import orjson
 
 class Storage:
     """Service for storing scraped data to files."""
@@ -23,56 +23,81 @@ class Storage:
         self.data_dir = Path(config.OUTPUT_CONFIG["DATA_DIR"])
         self.data_dir.mkdir(exist_ok=True)
 
-    def save_json(self, data, filename_prefix):
+    @staticmethod
+    def make_timestamp():
+        """
+        Create a timestamp for output filenames.
+
+        Returns:
+            Current time formatted as YYYYmmdd_HHMMSS
+        """
+        return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    def save_json(self, data, filename_prefix, timestamp=None):
         """
         Save data as a JSON file with timestamp.
 
         Args:
             data: Data to save (must be JSON serializable)
             filename_prefix: Prefix for the filename
+            timestamp: Filename timestamp to reuse across a batch (optional)
 
         Returns:
             Path to the saved file on success, None on failure
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self.make_timestamp()
         filename = f"{filename_prefix}_{timestamp}.json"
         filepath = self.data_dir / filename
 
+        # Write compact JSON unless pretty output is requested
+        option = orjson.OPT_NON_STR_KEYS
+        if self.config.OUTPUT_CONFIG["PRETTY"]:
+            option |= orjson.OPT_INDENT_2
+
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
             self.logger.info("Data saved to %s", filepath)
             return filepath
         except (IOError, TypeError, ValueError) as e:
             self.logger.error("Error saving data: %s", e)
             return None
 
-    def save_csv(self, data, filename_prefix, fieldnames=None):
+    def save_csv(self, data, filename_prefix, fieldnames=None, timestamp=None):
         """
         Save data as a CSV file with timestamp.
 
+        Rows are written as they are consumed, so passing a generator keeps
+        memory use flat for large datasets.
+
         Args:
-            data: List of dictionaries to save
+            data: Iterable of dictionaries to save
             filename_prefix: Prefix for the filename
             fieldnames: List of field names for CSV header (optional)
+            timestamp: Filename timestamp to reuse across a batch (optional)
 
         Returns:
             Path to the saved file on success, None on failure
         """
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or self.make_timestamp()
         filename = f"{filename_prefix}_{timestamp}.csv"
         filepath = self.data_dir / filename
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                if not fieldnames and data:
+            rows = iter(data)
+            first = next(rows, None)
+
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                if not fieldnames and first is not None:
                     # Use keys from first item if fieldnames not provided
-                    fieldnames = data[0].keys()
+                    fieldnames = first.keys()
 
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows(data)
+                if first is not None:
+                    writer.writerow(first)
+                writer.writerows(rows)
 
             self.logger.info("Data saved to %s", filepath)
             return filepath
@@ -2,35 +2,57 @@
 Logging utilities for the Daria scraper.
 """
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Background listener that writes queued log records; started once by setup_logging
+_listener = None
+
 def setup_logging(log_config):
     """
     Set up logging configuration.
 
+    Records are put on a queue and written to the file and console by a
+    background thread, so scraping threads never block on log I/O.
+
     Args:
         log_config: Dictionary with logging configuration
 
     Returns:
         Configured logger instance
     """
+    global _listener
+
+    logger = logging.getLogger("daria_scraper")
+    if _listener is not None:
+        return logger
+
     # Ensure log directory exists
     log_file = Path(log_config["LOG_FILE"])
     log_file.parent.mkdir(exist_ok=True)
 
+    # The queue handler formats each record, so the listener's handlers
+    # only write the finished line
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue,
+        logging.FileHandler(log_config["LOG_FILE"], encoding='utf-8', delay=True),
+        logging.StreamHandler(),
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, log_config["LEVEL"]),
         format=log_config["LOG_FORMAT"],
-        handlers=[
-            logging.FileHandler(log_config["LOG_FILE"]),
-            logging.StreamHandler()
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
 
-    logger = logging.getLogger("daria_scraper")
-
     # Log startup message
     logger.info("Logging initialized at level %s", log_config["LEVEL"])
 
@@ -0,0 +1,60 @@
+"""
+Rate limiting utilities for the Daria scraper.
+"""
+
+import threading
+import time
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `capacity` calls, then refills at `rate` tokens
+    per second, so callers only block once the bucket is empty.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second (0 disables limiting)
+            capacity: Maximum number of tokens, i.e. the allowed burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_delay(cls, delay, capacity):
+        """
+        Create a token bucket that averages one call every `delay` seconds.
+
+        Args:
+            delay: Average time between calls in seconds (0 disables limiting)
+            capacity: Maximum number of calls allowed in a burst
+
+        Returns:
+            TokenBucket instance
+        """
+        return cls(1 / delay if delay > 0 else 0, capacity)
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        if not self.rate:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            if self.tokens < 1:
+                # Hold the lock while waiting so other callers queue behind us
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0
+                self.last_refill = time.monotonic()
+            else:
+                self.tokens -= 1
@@ -0,0 +1,73 @@
+"""
+HTTP session utilities for the Daria scraper.
+"""
+
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+def create_session(config, data_dir):
+    """
+    Create a pooled, retrying HTTP session backed by an on-disk response cache.
+
+    Server Cache-Control headers take precedence over EXPIRE_AFTER. Expired
+    entries are kept so they can be revalidated with ETag/If-Modified-Since,
+    which costs a 304 round-trip instead of a full download.
+
+    Args:
+        config: Configuration object with request and cache settings
+        data_dir: Directory the cache database is stored in
+
+    Returns:
+        Configured CachedSession instance
+    """
+    data_dir = Path(data_dir)
+    data_dir.mkdir(exist_ok=True)
+
+    cache_config = config.CACHE_CONFIG
+    session = CachedSession(
+        cache_name=str(data_dir / cache_config["CACHE_NAME"]),
+        backend='sqlite',
+        expire_after=cache_config["EXPIRE_AFTER"],
+        allowable_methods=('GET',),
+        cache_control=True
+    )
+    session.headers.update(config.REQUEST_CONFIG["HEADERS"])
+
+    # Retry failed requests with backoff over a pooled adapter
+    request_config = config.REQUEST_CONFIG
+    retry = Retry(
+        total=request_config["RETRIES"],
+        backoff_factor=request_config["RETRY_DELAY"],
+        backoff_max=request_config["RETRY_MAX_DELAY"],
+        backoff_jitter=request_config["RETRY_JITTER"],
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        allowed_methods=frozenset(["GET", "HEAD"])
+    )
+    adapter = HTTPAdapter(
+        pool_connections=request_config["POOL_SIZE"],
+        pool_maxsize=request_config["POOL_SIZE"],
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+def get_cached(session, url):
+    """
+    Look up a fresh cached response without touching the network.
+
+    Callers use this to serve cache hits without waiting on the rate limiter.
+
+    Args:
+        session: CachedSession created by create_session
+        url: URL to look up
+
+    Returns:
+        Cached response, or None if the URL is not cached or has expired
+    """
+    response = session.get(url, only_if_cached=True)
+    return response if response.ok else None
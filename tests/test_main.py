@@ -0,0 +1,155 @@
+"""
+Tests for the lxml-based page handling in DariaScraper, using fixture HTML.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from daria_scraper import config
+from daria_scraper.main import DariaScraper
+
+BASE_URL = config.TARGETS[0]["base_url"]
+
+CHARACTERS_PAGE = b"""
+<html><body>
+  <a href="index.html">Home</a>
+  <a href="CH_Daria.html">Daria Morgendorffer</a>
+  <a href="ch_lane.html"> Jane </a>
+</body></html>
+"""
+
+CHARACTER_PAGE = """
+<html><body>
+  <p><b>Full Name:</b> Zoë Müller Current Age: 17</p>
+  <a href="art_alter-egos.html#zoe">Alter egos</a>
+</body></html>
+"""
+
+ALTER_EGOS_PAGE = b"""
+<html><body>
+  <p><a name="daria"></a><img src="img/daria_0.jpg"></p>
+  <div id="daria">
+    <img src="img/Daria_1.jpg" width="100" height="50">
+    <img src="img/daria_1.JPG">
+    <img src="https://example.com/daria_2.jpg">
+    <img src="img/jane_1.jpg">
+  </div>
+  <p><a name="jane"></a><img src="img/jane_2.jpg"></p>
+  <img src="img/daria_9.jpg">
+</body></html>
+"""
+
+def make_response(content, encoding=None):
+    """Build a minimal stand-in for a requests response."""
+    return SimpleNamespace(content=content, encoding=encoding)
+
+@pytest.fixture
+def scraper():
+    # Skip __init__ so no log files, cache database or sessions are created
+    instance = DariaScraper.__new__(DariaScraper)
+    instance.logger = logging.getLogger("daria_scraper.tests")
+    instance.target = config.TARGETS[0]
+    return instance
+
+def serve(scraper, pages):
+    """Make the scraper fetch pages from a {url: response} dict."""
+    scraper.fetch_page = pages.get
+
+def test_parse_tree_decodes_with_response_charset(scraper):
+    # No <meta charset>, so only the Content-Type charset says this is UTF-8
+    tree = scraper.parse_tree(CHARACTER_PAGE.encode("utf-8"), "utf-8")
+
+    assert scraper.extract_character_name(tree) == "Zoë Müller"
+
+@pytest.mark.parametrize("content", [b"", b"   ", b"<!-- nothing here -->"])
+def test_parse_tree_tolerates_empty_body(scraper, content):
+    tree = scraper.parse_tree(content, "utf-8")
+
+    assert scraper.extract_character_name(tree) == ""
+    assert scraper.find_alter_egos_link(tree, "daria") == (None, None)
+    assert scraper.extract_character_alter_egos(tree, "daria", None) == []
+
+def test_find_character_page_by_href_ignores_case(scraper):
+    serve(scraper, {f"{BASE_URL}/characters.html": make_response(CHARACTERS_PAGE)})
+
+    assert scraper.find_character_page("daria") == f"{BASE_URL}/CH_Daria.html"
+
+def test_find_character_page_falls_back_to_link_text(scraper):
+    serve(scraper, {f"{BASE_URL}/characters.html": make_response(CHARACTERS_PAGE)})
+
+    assert scraper.find_character_page("Jane") == f"{BASE_URL}/ch_lane.html"
+
+def test_find_character_page_not_found(scraper):
+    serve(scraper, {f"{BASE_URL}/characters.html": make_response(CHARACTERS_PAGE)})
+
+    assert scraper.find_character_page("quinn") is None
+
+def test_find_alter_egos_link_splits_fragment(scraper):
+    tree = scraper.parse_tree(CHARACTER_PAGE.encode("utf-8"), "utf-8")
+
+    assert scraper.find_alter_egos_link(tree, "zoe") == (
+        f"{BASE_URL}/art_alter-egos.html", "zoe"
+    )
+
+def test_find_alter_egos_link_without_fragment(scraper):
+    tree = scraper.parse_tree(b'<a href="art_alter-egos.html">Alter egos</a>', "utf-8")
+
+    assert scraper.find_alter_egos_link(tree, "daria") == (
+        f"{BASE_URL}/art_alter-egos.html", None
+    )
+
+def test_alter_egos_prefer_section_by_id(scraper):
+    tree = scraper.parse_tree(ALTER_EGOS_PAGE, "utf-8")
+
+    images = scraper.extract_character_alter_egos(tree, "Daria", "daria")
+
+    # The id wins over the <a name> anchor, duplicates differing only in case are
+    # dropped and absolute URLs are kept as they are
+    assert images == [
+        {"link": f"{BASE_URL}/img/Daria_1.jpg", "width": "100", "height": "50"},
+        {"link": "https://example.com/daria_2.jpg", "width": "", "height": ""},
+    ]
+
+def test_alter_egos_section_by_anchor(scraper):
+    tree = scraper.parse_tree(ALTER_EGOS_PAGE, "utf-8")
+
+    images = scraper.extract_character_alter_egos(tree, "jane", "jane")
+
+    assert [image["link"] for image in images] == [f"{BASE_URL}/img/jane_2.jpg"]
+
+def test_alter_egos_search_whole_page_without_section(scraper):
+    tree = scraper.parse_tree(ALTER_EGOS_PAGE, "utf-8")
+
+    images = scraper.extract_character_alter_egos(tree, "daria", "missing")
+
+    assert [image["link"] for image in images] == [
+        f"{BASE_URL}/img/daria_0.jpg",
+        f"{BASE_URL}/img/Daria_1.jpg",
+        "https://example.com/daria_2.jpg",
+        f"{BASE_URL}/img/daria_9.jpg",
+    ]
+
+def test_scrape_character_end_to_end(scraper):
+    alter_egos_page = b'<div id="zoe"><img src="zoe_1.jpg"></div>'
+    serve(scraper, {
+        f"{BASE_URL}/characters.html": make_response(b'<a href="ch_zoe.html">Zoe</a>'),
+        f"{BASE_URL}/ch_zoe.html": make_response(CHARACTER_PAGE.encode("utf-8"), "utf-8"),
+        f"{BASE_URL}/art_alter-egos.html": make_response(alter_egos_page, "utf-8"),
+    })
+
+    assert scraper.scrape_character("zoe") == {
+        "url": f"{BASE_URL}/ch_zoe.html",
+        "full_name": "Zoë Müller",
+        "alter_egos_images": [{"link": f"{BASE_URL}/zoe_1.jpg", "width": "", "height": ""}],
+    }
+
+def test_scrape_character_with_empty_alter_egos_page(scraper):
+    serve(scraper, {
+        f"{BASE_URL}/characters.html": make_response(b'<a href="ch_zoe.html">Zoe</a>'),
+        f"{BASE_URL}/ch_zoe.html": make_response(CHARACTER_PAGE.encode("utf-8"), "utf-8"),
+        f"{BASE_URL}/art_alter-egos.html": make_response(b"", "utf-8"),
+    })
+
+    assert scraper.scrape_character("zoe")["alter_egos_images"] == []
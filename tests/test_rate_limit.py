@@ -0,0 +1,81 @@
+"""
+Tests for the token bucket rate limiter.
+"""
+
+from unittest import mock
+
+import pytest
+
+from daria_scraper.utils.rate_limit import TokenBucket
+
+class FakeClock:
+    """Monotonic clock that only advances when sleep is called."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with mock.patch("daria_scraper.utils.rate_limit.time.monotonic", fake.monotonic), \
+         mock.patch("daria_scraper.utils.rate_limit.time.sleep", fake.sleep):
+        yield fake
+
+def test_burst_is_allowed_without_sleeping(clock):
+    bucket = TokenBucket(rate=2, capacity=4)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+def test_steady_state_spacing_is_one_over_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=4)
+    for _ in range(4):
+        bucket.acquire()
+
+    acquired_at = []
+    for _ in range(5):
+        bucket.acquire()
+        acquired_at.append(clock.now)
+
+    assert clock.sleeps == pytest.approx([0.5] * 5)
+    gaps = [later - earlier for earlier, later in zip(acquired_at, acquired_at[1:])]
+    assert gaps == pytest.approx([0.5] * 4)
+
+def test_tokens_refill_while_idle(clock):
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    # Idle time refills the bucket, but never beyond its capacity
+    clock.now += 10
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == pytest.approx([1.0])
+
+def test_zero_delay_never_sleeps(clock):
+    bucket = TokenBucket.from_delay(0, 1)
+
+    for _ in range(100):
+        bucket.acquire()
+
+    assert bucket.rate == 0
+    assert clock.sleeps == []
+
+def test_from_delay_sets_rate():
+    bucket = TokenBucket.from_delay(0.5, 3)
+
+    assert bucket.rate == pytest.approx(2)
+    assert bucket.capacity == 3